@@ -1,7 +1,8 @@
 # solar_app.py
-import math
+from bisect import bisect_left
+
+import numpy as np
 import streamlit as st
-import pandas as pd
 
 st.set_page_config(
     page_title="Solar Energy Analyzer",
@@ -18,38 +19,106 @@ st.write(
 # 1. LOCATION DATABASE – MONTHLY GHI (kWh/m² per month)
 #    Values are approximate typical data, not exact.
 # ----------------------------------------------------
-MONTH_NAMES = ["Jan", "Feb", "Mar", "Apr", "May", "Jun",
-               "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
-
+MONTH_NAMES = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+               "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+# Structure-of-arrays layout: row i of every array below describes
+# LOCATION_NAMES[i], so batch computations over all cities vectorize.
+LOCATION_NAMES = ("Kolkata, India", "Delhi, India", "Hamburg, Germany",
+                  "Munich, Germany", "Berlin, Germany")
+LAT = np.array([22.6, 28.6, 53.5, 48.1, 52.5])
 # kWh/m²/month – rough but realistic patterns
-SOLAR_LOCATIONS = {
-    "Kolkata, India": {
-        "lat": 22.6,
-        "monthly_ghi": [120, 115, 140, 160, 170, 155, 150, 150, 145, 130, 110, 105],
-    },
-    "Delhi, India": {
-        "lat": 28.6,
-        "monthly_ghi": [130, 135, 160, 180, 200, 190, 185, 180, 160, 140, 120, 115],
-    },
-    "Hamburg, Germany": {
-        "lat": 53.5,
-        "monthly_ghi": [25, 45, 80, 115, 150, 165, 160, 135, 95, 60, 30, 18],
-    },
-    "Munich, Germany": {
-        "lat": 48.1,
-        "monthly_ghi": [40, 60, 100, 135, 165, 175, 175, 150, 110, 70, 40, 30],
-    },
-    "Berlin, Germany": {
-        "lat": 52.5,
-        "monthly_ghi": [30, 50, 90, 125, 155, 170, 165, 140, 100, 65, 35, 22],
-    },
+MONTHLY_GHI = np.array([
+    [120, 115, 140, 160, 170, 155, 150, 150, 145, 130, 110, 105],
+    [130, 135, 160, 180, 200, 190, 185, 180, 160, 140, 120, 115],
+    [25, 45, 80, 115, 150, 165, 160, 135, 95, 60, 30, 18],
+    [40, 60, 100, 135, 165, 175, 175, 150, 110, 70, 40, 30],
+    [30, 50, 90, 125, 155, 170, 165, 140, 100, 65, 35, 22],
+], dtype=np.float64)
+NAME_TO_IDX = {name: i for i, name in enumerate(LOCATION_NAMES)}
+
+# Derived quantities are static, so compute them once at import time rather
+# than on every Streamlit rerun.
+ANNUAL_GHI = MONTHLY_GHI.sum(axis=1)  # kWh/m²/year
+DAILY_GHI = ANNUAL_GHI / 365.0  # kWh/m²/day
+MONTHLY_FRACTIONS = MONTHLY_GHI / ANNUAL_GHI[:, np.newaxis]
+
+# Orientation factor – simple multipliers
+ORIENTATION_FACTORS = {
+    "South (ideal in N hemisphere)": 1.0,
+    "South-East / South-West": 0.95,
+    "East / West": 0.90,
+    "Flat / Horizontal": 0.88,
 }
 
-def get_annual_and_daily_ghi(location_data: dict):
-    monthly = location_data["monthly_ghi"]
-    annual_ghi = sum(monthly)  # kWh/m²/year
-    daily_ghi = annual_ghi / 365.0  # kWh/m²/day
-    return annual_ghi, daily_ghi
+# Tilt factor by |tilt - latitude| bucket: <=10°, <=20°, beyond
+_TILT_EDGES = (10, 20)
+_TILT_BUCKETS = (1.0, 0.96, 0.90)
+
+# Pre-bound formatters and constant unit suffixes for the metrics block;
+# cheaper than re-evaluating f-strings on every rerun.
+_F0 = "{:.0f}".format
+_F1 = "{:.1f}".format
+_F2 = "{:.2f}".format
+_UNIT_KWH_M2_DAY = " kWh/m²/day"
+_UNIT_KWH_KWP_YEAR = " kWh/kWp/year"
+_UNIT_KWH_YEAR = " kWh/year"
+
+def _solar_kernel(daily_ghi, orientation_factor, tilt_factor, pr,
+                  efficiency_factor, system_size_kw, monthly_fractions):
+    """Numeric core of the yield estimate; JIT-compiled when numba is present."""
+    daily_irradiation_tilt = daily_ghi * orientation_factor * tilt_factor
+    specific_yield = daily_irradiation_tilt * 365.0 * pr * efficiency_factor
+    annual_energy_kwh = specific_yield * system_size_kw
+    capacity_factor = annual_energy_kwh / (system_size_kw * 8760.0)
+    monthly_energies = monthly_fractions * annual_energy_kwh
+    return (daily_irradiation_tilt, specific_yield, annual_energy_kwh,
+            capacity_factor, monthly_energies)
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; plain Python is fine for 12 floats
+    pass
+else:
+    # cache=True persists the compiled kernel on disk across app restarts.
+    _solar_kernel = njit(cache=True)(_solar_kernel)
+
+@st.cache_data(max_entries=256)
+def compute_solar(location: str, system_size_kw: float, panel_efficiency: float,
+                  tilt_angle: int, orientation: str,
+                  system_losses_pct: int) -> dict:
+    """Pure arithmetic for one parameter combination, memoized so repeated
+    slider positions and unrelated reruns are served from cache."""
+    idx = NAME_TO_IDX[location]
+    ghi_daily = DAILY_GHI[idx]
+
+    orientation_factor = ORIENTATION_FACTORS[orientation]
+
+    tilt_diff = abs(tilt_angle - LAT[idx])
+    tilt_factor = _TILT_BUCKETS[bisect_left(_TILT_EDGES, tilt_diff)]
+
+    # System losses → Performance Ratio
+    pr = 1.0 - system_losses_pct / 100.0
+
+    # Panel efficiency relative to the 19% reference module the 1 kWp ~
+    # 1 kW/m² simplification assumes.
+    efficiency_factor = panel_efficiency / 19.0
+
+    # Daily GHI adjusted by orientation & tilt, then specific yield, annual
+    # energy, capacity factor and the monthly split, all in one kernel call.
+    # Assuming 1 kWp ~ 1 kW/m² effective; this is a simplification.
+    (daily_irradiation_tilt, specific_yield, annual_energy_kwh,
+     capacity_factor, monthly_energies) = _solar_kernel(
+        ghi_daily, orientation_factor, tilt_factor, pr,
+        efficiency_factor, system_size_kw, MONTHLY_FRACTIONS[idx])
+
+    return {
+        "daily_irradiation_tilt": daily_irradiation_tilt,
+        "specific_yield": specific_yield,
+        "annual_energy_kwh": annual_energy_kwh,
+        "capacity_factor": capacity_factor,
+        "monthly_energies": monthly_energies,
+    }
 
 # ----------------------------------------------------
 # 2. SIDEBAR INPUTS
@@ -58,11 +127,10 @@ st.sidebar.header("Inputs")
 
 location = st.sidebar.selectbox(
     "Location",
-    options=list(SOLAR_LOCATIONS.keys()),
+    options=LOCATION_NAMES,
     index=0
 )
-loc_data = SOLAR_LOCATIONS[location]
-annual_ghi, ghi_daily = get_annual_and_daily_ghi(loc_data)
+loc_idx = NAME_TO_IDX[location]
 
 system_size_kw = st.sidebar.number_input(
     "System size (kW)",
@@ -84,7 +152,7 @@ tilt_angle = st.sidebar.slider(
     "Tilt angle (degrees)",
     min_value=0,
     max_value=60,
-    value=int(loc_data["lat"]),
+    value=int(LAT[loc_idx]),
     step=1,
     key=f"tilt_angle_{location}"
 )
@@ -108,96 +176,68 @@ system_losses_pct = st.sidebar.slider(
 )
 
 # ----------------------------------------------------
-# 3. CALCULATIONS
+# 3. CALCULATIONS & OUTPUTS
 # ----------------------------------------------------
-# Orientation factor – simple multipliers
-if orientation == "South (ideal in N hemisphere)":
-    orientation_factor = 1.0
-elif orientation == "South-East / South-West":
-    orientation_factor = 0.95
-elif orientation == "East / West":
-    orientation_factor = 0.90
-else:  # Flat / Horizontal
-    orientation_factor = 0.88
-
-lat = loc_data["lat"]
-tilt_diff = abs(tilt_angle - lat)
-if tilt_diff <= 10:
-    tilt_factor = 1.0
-elif tilt_diff <= 20:
-    tilt_factor = 0.96
-else:
-    tilt_factor = 0.90
-
-# Adjust daily GHI by orientation & tilt
-daily_irradiation_tilt = ghi_daily * orientation_factor * tilt_factor  # kWh/m²/day
-
-# System losses → Performance Ratio
-pr = 1.0 - system_losses_pct / 100.0
-
-# Specific yield & annual energy
-# Assuming 1 kWp ~ 1 kW/m² effective; this is a simplification.
-specific_yield = daily_irradiation_tilt * 365.0 * pr  # kWh/kWp/year (approx)
-annual_energy_kwh = specific_yield * system_size_kw
-
-capacity_factor = annual_energy_kwh / (system_size_kw * 8760.0)
-
-# Monthly energy distribution based on monthly_ghi share
-monthly_ghi = loc_data["monthly_ghi"]
-annual_ghi_tilt = annual_ghi * orientation_factor * tilt_factor
-if annual_ghi_tilt > 0:
-    monthly_fractions = [m / annual_ghi for m in monthly_ghi]
-else:
-    monthly_fractions = [1.0 / 12.0] * 12
-
-monthly_energies = [annual_energy_kwh * f for f in monthly_fractions]
-
-df_monthly = pd.DataFrame({
-    "Month": MONTH_NAMES,
-    "Energy (kWh)": monthly_energies
-}).set_index("Month")
-
-# ----------------------------------------------------
-# 4. OUTPUTS
-# ----------------------------------------------------
-col1, col2 = st.columns(2)
-
-with col1:
-    st.subheader("Key Results")
-
-    st.metric(
-        "Daily solar irradiation (horizontal)",
-        f"{ghi_daily:.2f} kWh/m²/day"
-    )
-    st.metric(
-        "Daily solar irradiation on tilted plane",
-        f"{daily_irradiation_tilt:.2f} kWh/m²/day"
-    )
-    st.metric(
-        "Specific yield",
-        f"{specific_yield:.0f} kWh/kWp/year"
-    )
-    st.metric(
-        "Annual energy output",
-        f"{annual_energy_kwh:.0f} kWh/year"
-    )
-    st.metric(
-        "Capacity factor",
-        f"{capacity_factor*100:.1f} %"
-    )
-
-with col2:
-    st.subheader("Monthly Energy Production")
-    st.bar_chart(df_monthly)
-
-st.markdown("---")
-st.subheader("Assumptions & Notes")
-st.write(
-    """
+@st.fragment
+def render_results(location, system_size_kw, panel_efficiency,
+                   tilt_angle, orientation, system_losses_pct):
+    """Fragment so only this block reruns, not the whole script."""
+    results = compute_solar(location, system_size_kw, panel_efficiency,
+                            tilt_angle, orientation, system_losses_pct)
+    daily_irradiation_tilt = results["daily_irradiation_tilt"]
+    specific_yield = results["specific_yield"]
+    annual_energy_kwh = results["annual_energy_kwh"]
+    capacity_factor = results["capacity_factor"]
+    monthly_energies = results["monthly_energies"]
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("Key Results")
+
+        st.metric(
+            "Daily solar irradiation (horizontal)",
+            _F2(DAILY_GHI[NAME_TO_IDX[location]]) + _UNIT_KWH_M2_DAY
+        )
+        st.metric(
+            "Daily solar irradiation on tilted plane",
+            _F2(daily_irradiation_tilt) + _UNIT_KWH_M2_DAY
+        )
+        st.metric(
+            "Specific yield",
+            _F0(specific_yield) + _UNIT_KWH_KWP_YEAR
+        )
+        st.metric(
+            "Annual energy output",
+            _F0(annual_energy_kwh) + _UNIT_KWH_YEAR
+        )
+        st.metric(
+            "Capacity factor",
+            _F1(capacity_factor * 100) + " %"
+        )
+
+    with col2:
+        st.subheader("Monthly Energy Production")
+        # Plain dict input lets Streamlit do the conversion internally and
+        # keeps pandas out of the hot rerun path entirely.
+        st.bar_chart(
+            {"Month": MONTH_NAMES, "Energy (kWh)": monthly_energies.tolist()},
+            x="Month",
+            y="Energy (kWh)",
+        )
+
+    st.markdown("---")
+    st.subheader("Assumptions & Notes")
+    st.write(
+        """
 - Monthly solar irradiation values are approximate, location-specific typical values (kWh/m²/month).
 - Annual GHI is the sum of monthly values; daily GHI = annual GHI / 365.
 - Tilt and orientation are modeled with simple multipliers, not full sun-path geometry.
 - Performance Ratio (PR) is derived directly from the total losses slider: PR = 1 − losses.
+- Panel efficiency scales the yield relative to a 19% reference module.
 - Capacity factor = annual energy / (rated power × 8760).
 """
-)
+    )
+
+render_results(location, system_size_kw, panel_efficiency,
+               tilt_angle, orientation, system_losses_pct)